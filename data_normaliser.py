@@ -1,14 +1,169 @@
 import csv
 import datetime
+import functools
+import io
+import itertools
 import logging
-from typing import List
+import mmap
+import operator
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import (Any, ClassVar, Dict, Iterable, Iterator, List, Optional,
+                    Sequence, Tuple)
+
+try:
+    import pandas as pd  # type: ignore
+except ImportError:  # pragma: no cover
+    pd = None
+
+# `mypyc_attr` keeps the classes subclassable from interpreted code when the
+# module is compiled with mypyc
+try:
+    from mypy_extensions import mypyc_attr
+except ImportError:  # pragma: no cover
+    def mypyc_attr(*attrs, **kwattrs):  # type: ignore
+        """No-op stand-in, only used when the module is not compiled."""
+        return lambda cls: cls
 
 logger = logging.getLogger(__name__)
 
+# (Transaction attribute, builder method name, builder kwargs) entries
+FieldPlan = Sequence[Tuple[str, str, Dict[str, Any]]]
+
+_strptime = datetime.datetime.strptime
+
+_DAY_MONTH_YEAR = re.compile(r'([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})')
+_DAY_ABBR_MONTH_YEAR = re.compile(r'([0-9]{1,2})-([A-Za-z]{3})-([0-9]{2})')
+_MONTH_ABBRS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+
+def _parse_day_month_year(value) -> datetime.datetime:
+    """Parses '%d/%m/%Y' dates without going through strptime. Anything
+    the fast path does not recognise is handed to strptime."""
+    match = _DAY_MONTH_YEAR.fullmatch(value)
+    if match is None:
+        return _strptime(value, '%d/%m/%Y')
+    day, month, year = match.groups()
+    return datetime.datetime(int(year), int(month), int(day))
+
+
+def _parse_day_abbr_month_year(value) -> datetime.datetime:
+    """Parses '%d-%b-%y' dates (English month abbreviations) without going
+    through strptime. Anything the fast path does not recognise is handed
+    to strptime."""
+    match = _DAY_ABBR_MONTH_YEAR.fullmatch(value)
+    month = _MONTH_ABBRS.get(match.group(2).lower()) if match else None
+    if match is None or month is None:
+        return _strptime(value, '%d-%b-%y')
+    year = int(match.group(3))
+    year += 2000 if year < 69 else 1900  # Same pivot as strptime's %y
+    return datetime.datetime(year, month, int(match.group(1)))
+
+
+# Specialised parsers for the date formats used by the converters
+_DATE_PARSERS = {
+    '%d/%m/%Y': _parse_day_month_year,
+    '%d-%b-%y': _parse_day_abbr_month_year,
+}
+
+# Parsed dates keyed by (date_format, raw value). Claim files repeat the same
+# claim dates and birth dates on many rows, so most lookups skip parsing.
+_DATE_CACHE = {}  # type: Dict[Tuple[str, str], datetime.datetime]
+
+
+def _parse_date(value, date_format) -> datetime.datetime:
+    """Parses `value` with `date_format`, memoising successful parses."""
+    key = (date_format, value)
+    try:
+        return _DATE_CACHE[key]
+    except KeyError:
+        parser = _DATE_PARSERS.get(date_format)
+        if parser is None:
+            parsed = _strptime(value, date_format)
+        else:
+            parsed = parser(value)
+        _DATE_CACHE[key] = parsed
+        return parsed
+
+
+# Formatted dates keyed by (date_format, datetime), the output side of
+# `_DATE_CACHE`.
+_FORMAT_CACHE = {}  # type: Dict[Tuple[str, datetime.datetime], str]
+
+
+def _format_date(value, date_format) -> str:
+    """Formats `value` with `date_format`, memoising the result."""
+    key = (date_format, value)
+    try:
+        return _FORMAT_CACHE[key]
+    except KeyError:
+        formatted = _FORMAT_CACHE[key] = value.strftime(date_format)
+        return formatted
+
+
+def _log_conversion_error(row, error):
+    logger.error('Error converting record to Transaction '
+                 '(Error: %s): Row %d', error, row)
+
+
+def _convert_chunk(converter_class, *args):
+    """Process pool entry point for `convert_parallel`."""
+    return converter_class().convert_chunk(*args)
+
+
+def _int_or_none(value) -> Optional[int]:
+    """Returns int(value), or None for values `int` rejects."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _float_or_nan(value) -> float:
+    """Returns float(value), or NaN for values `float` rejects."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+def _defining_class(cls, name) -> type:
+    """Returns the class in the mro of `cls` that defines `name`."""
+    return next(klass for klass in cls.__mro__ if name in vars(klass))
+
+
+def _compose(outer, inner):
+    """Returns a callable that applies `inner` and then `outer`."""
+    return lambda value: outer(inner(value))
+
+
+# The `Transaction` attributes, in the order of the normalised csv fields and
+# of `Transaction`'s positional arguments
+_TRANSACTION_ATTRIBUTES = (
+    'transaction_id',
+    'date_claimed',
+    'first_name',
+    'last_name',
+    'dob',
+    'item_id',
+    'item_description',
+    'cost',
+    'fund_cover',
+    'payment_method',
+    'provider',
+    'health_fund',
+)
+
 
 class Transaction:
     """Represents a normalised transaction object from a health insurer."""
 
+    __slots__ = _TRANSACTION_ATTRIBUTES
+
     def __init__(self, transaction_id: int, date_claimed: datetime.datetime,
                  first_name: str, last_name: str, dob: datetime.datetime,
                  item_id: str, item_description: str, cost: float,
@@ -28,6 +183,7 @@ class Transaction:
         self.health_fund = health_fund
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class TransactionsCSVWriter:
     """Class to convert a list of `Transaction` objects to a csv file"""
 
@@ -47,20 +203,29 @@ class TransactionsCSVWriter:
         'HealthFund'
     ]
 
+    date_claimed_format = '%d-%b-%y'
+    dob_format = '%d/%m/%Y'
+
+    # Output files are written through a large buffer, so rows reach the
+    # disk in few write() calls
+    buffer_size = 1 << 20
+
     def dictify_transaction(self, transaction: Transaction) -> dict:
         """Converts a `Transaction` into a dictionary, with the `field_names`
         as keys. The values will be correctly formatted for CSV import
         purposes.
 
         An exception will be raised if fields are missing or cannot be
-        formatted.
+        formatted. Each call returns a new dictionary, so callers may keep or
+        modify it.
         """
         return {
             'TransactionID': transaction.transaction_id,
-            'DateClaimed': transaction.date_claimed.strftime('%d-%b-%y'),
+            'DateClaimed': _format_date(transaction.date_claimed,
+                                        self.date_claimed_format),
             'FirstName': transaction.first_name,
             'LastName': transaction.last_name,
-            'DateOfBirth': transaction.dob.strftime('%d/%m/%Y'),
+            'DateOfBirth': _format_date(transaction.dob, self.dob_format),
             'ItemID': transaction.item_id,
             'ItemDescription': transaction.item_description,
             'Cost': transaction.cost,
@@ -70,9 +235,39 @@ class TransactionsCSVWriter:
             'HealthFund': transaction.health_fund,
         }
 
-    def create_csv(self, transactions: List[Transaction], filename):
+    def tuplify_transaction(self, transaction: Transaction) -> tuple:
+        """Converts a `Transaction` into a tuple of values in `field_names`
+        order, formatted the same way as `dictify_transaction`.
+        """
+        return (
+            transaction.transaction_id,
+            _format_date(transaction.date_claimed, self.date_claimed_format),
+            transaction.first_name,
+            transaction.last_name,
+            _format_date(transaction.dob, self.dob_format),
+            transaction.item_id,
+            transaction.item_description,
+            transaction.cost,
+            transaction.fund_cover,
+            transaction.payment_method,
+            transaction.provider,
+            transaction.health_fund,
+        )
+
+    def value_formatters(self) -> dict:
+        """Maps `Transaction` attributes to the callables that format their
+        values for the csv file. Other attributes are written as they are.
+        """
+        return {
+            'date_claimed': functools.partial(
+                _format_date, date_format=self.date_claimed_format),
+            'dob': functools.partial(_format_date,
+                                     date_format=self.dob_format),
+        }
+
+    def create_csv(self, transactions: Iterable[Transaction], filename):
         """
-        Converts the given list of `Transaction` objects into a csv file with
+        Converts the given `Transaction` objects into a csv file with
         the name given in the `filename` parameter in the current working
          directory.
 
@@ -81,58 +276,210 @@ class TransactionsCSVWriter:
 
         The final output will be a CSV file and a message with the error count.
         """
+        self.write_rows(self._tuplify_transactions(transactions), filename)
+
+    def _tuplify_transactions(self, transactions):
+        for transaction in transactions:
+            try:
+                yield self.tuplify_transaction(transaction)
+            except Exception as e:
+                logger.error(e)
+
+    def write_rows(self, rows: Iterable[tuple], filename):
+        """
+        Writes rows of already formatted values, in `field_names` order, into
+        a csv file with the name given in the `filename` parameter.
+        """
+        full_file_name = "{}.csv".format(filename)
+        with open(full_file_name, 'w', buffering=self.buffer_size,
+                  newline='') as f:
+            self.write_rows_to(f, itertools.chain([self.field_names], rows),
+                               logger.error)
+
+        logger.info('CSV file created - %s', full_file_name)
+
+    def write_rows_to(self, f, rows: Iterable[Sequence], on_error):
+        """
+        Writes rows of already formatted values into the open text file `f`.
+        Rows that cannot be written are skipped and their exception is passed
+        to `on_error`.
+        """
+        writerow = csv.writer(f, quoting=csv.QUOTE_NONE).writerow
+        for row in rows:
+            try:
+                writerow(row)
+            except Exception as e:
+                on_error(e)
+
+    def write_chunks(self, chunks: Iterable[str], filename):
+        """
+        Writes the header followed by chunks of csv text, as produced by
+        `write_rows_to`, into a csv file with the name given in the
+        `filename` parameter.
+        """
         full_file_name = "{}.csv".format(filename)
-        with open(full_file_name, 'w') as f:
-            writer = csv.DictWriter(f, quoting=csv.QUOTE_NONE,
-                                    fieldnames=self.field_names)
-            writer.writeheader()
-            for transaction in transactions:
-                try:
-                    transaction_dict = self.dictify_transaction(transaction)
-                    writer.writerow(transaction_dict)
-                except Exception as e:
-                    logger.error(e)
+        with open(full_file_name, 'w', buffering=self.buffer_size,
+                  newline='') as f:
+            self.write_rows_to(f, [self.field_names], logger.error)
+            for chunk in chunks:
+                f.write(chunk)
+
+        logger.info('CSV file created - %s', full_file_name)
+
+    def _format_date_column(self, column, date_format):
+        # Dates repeat heavily, so only format each distinct date once
+        codes, uniques = pd.factorize(column)
+        return pd.Series(uniques.strftime(date_format).to_numpy()[codes],
+                         index=column.index)
+
+    def format_frame(self, frame) -> Tuple[str, list]:
+        """
+        Formats a `pandas.DataFrame` with one (already validated) column per
+        `Transaction` attribute into csv text without the header, formatting
+        the date columns the same way as `create_csv`.
+
+        Returns the text and (index, exception) pairs for the rows that were
+        skipped because `write_rows_to` would reject them.
+        """
+        frame = frame.assign(
+            date_claimed=self._format_date_column(frame['date_claimed'],
+                                                  self.date_claimed_format),
+            dob=self._format_date_column(frame['dob'], self.dob_format),
+        )[list(_TRANSACTION_ATTRIBUTES)]
+        errors = []  # type: List[Tuple[Any, Exception]]
+        try:
+            return self._frame_to_csv(frame), errors
+        except csv.Error:
+            # Some value needs escaping, so find the rows one at a time
+            for i, row in zip(frame.index, frame.itertuples(index=False)):
+                self.write_rows_to(io.StringIO(), [row],
+                                   lambda error: errors.append((i, error)))
+        frame = frame.drop(index=[i for i, _ in errors])
+        return self._frame_to_csv(frame), errors
+
+    def _frame_to_csv(self, frame):
+        return frame.to_csv(header=False, index=False, quoting=csv.QUOTE_NONE,
+                            lineterminator='\r\n')
+
+    def create_csv_from_frame(self, frame, filename):
+        """
+        Bulk counterpart of `create_csv`. Writes a `pandas.DataFrame` with one
+        (already validated) column per `Transaction` attribute into a csv
+        file, formatting the values the same way as `create_csv`.
 
-        logger.info('CSV file created - {}'.format(full_file_name))
+        Rows that cannot be written are skipped and logged, as in
+        `create_csv`.
+        """
+        text, errors = self.format_frame(frame)
+        for _, error in errors:
+            logger.error(error)
+        self.write_chunks([text], filename)
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class AbstractCustomerToTransactionCSVConverter:
     """Abstract class that defines the methods to convert a customer
     CSV file into a Lorica normalised transactions CSV file.
 
     Basic Logic:
-    Customer CSV -> List[Transaction] -> Normalised CSV File
+    Customer CSV -> Iterator[Transaction] -> Normalised CSV File
+
+    `convert` fuses the middle step for converters with a `FIELD_PLAN`:
+    each row is validated and formatted straight into the output values
+    without building a `Transaction`. Converters that override
+    `convert_row_to_transaction`, or whose writer overrides
+    `tuplify_transaction`, keep going through `Transaction` objects.
+
+    Implementations declare `FIELD_PLAN`, a sequence of
+    (Transaction attribute, builder method name, builder kwargs) tuples in
+    the order the fields should be validated. Converters without a
+    `FIELD_PLAN` can still override `convert_row_to_transaction` instead.
     """
 
+    FIELD_PLAN = None  # type: ClassVar[Optional[FieldPlan]]
+
     def __init__(self):
+        self._field_plan = self.compile_field_plan()
         self.normalised_csv_writer = TransactionsCSVWriter()
 
+    @property
+    def normalised_csv_writer(self) -> TransactionsCSVWriter:
+        return self._normalised_csv_writer
+
+    @normalised_csv_writer.setter
+    def normalised_csv_writer(self, writer: TransactionsCSVWriter):
+        # The output plan depends on the writer, so it is compiled again
+        self._normalised_csv_writer = writer
+        self._output_plan, self._output_order = self.compile_output_plan()
+
+    def compile_field_plan(self):
+        """Resolves `FIELD_PLAN` into (attribute, builder) pairs, where each
+        builder only needs the row, so no method lookups happen per row.
+        Returns None for converters without a `FIELD_PLAN`."""
+        if self.FIELD_PLAN is None:
+            return None
+        return [
+            (attribute, functools.partial(getattr(self, builder), **kwargs))
+            for attribute, builder, kwargs in self.FIELD_PLAN
+        ]
+
+    def compile_output_plan(self):
+        """Composes the field plan with the writer's value formatters, so a
+        row can be converted straight into csv values without building a
+        `Transaction`. Returns the builders (in validation order) and an
+        itemgetter that puts their results into `field_names` order.
+
+        The builders are None when rows have to go through
+        `convert_row_to_transaction` instead: for converters without a
+        `FIELD_PLAN` (the itemgetter is then None too), that override
+        `convert_row_to_transaction` or whose writer overrides
+        `tuplify_transaction`."""
+        if self._field_plan is None:
+            return None, None
+        attributes = [attribute for attribute, _ in self._field_plan]
+        order = operator.itemgetter(*[attributes.index(name)
+                                      for name in _TRANSACTION_ATTRIBUTES])
+        if (type(self).convert_row_to_transaction is not
+                AbstractCustomerToTransactionCSVConverter
+                .convert_row_to_transaction or
+                type(self.normalised_csv_writer).tuplify_transaction is not
+                TransactionsCSVWriter.tuplify_transaction):
+            return None, order
+        formatters = self.normalised_csv_writer.value_formatters()
+        builders = [
+            _compose(formatters[attribute], build)
+            if attribute in formatters else build
+            for attribute, build in self._field_plan
+        ]
+        return builders, order
+
     def _build_string_value(self, row, fieldname):
-        try:
-            if not row[fieldname]:
-                raise Exception('No data in field')
-            return row[fieldname]
-        except Exception:
+        value = row.get(fieldname)
+        if not value:
             raise ValueError('Invalid value for {}'.format(fieldname))
+        return value
 
     def _build_monetary_value(self, row, fieldname):
         try:
-            return float(row[fieldname])
-        except Exception:
+            return float(row.get(fieldname))
+        except (TypeError, ValueError):
             raise ValueError('Invalid value for {}'.format(fieldname))
 
-    def build_transaction_id(self, row, fieldname='TransactionID'):
+    def _build_date_value(self, row, date_format, fieldname):
         try:
-            return int(row[fieldname])
-        except Exception:
+            return _parse_date(row.get(fieldname), date_format)
+        except (TypeError, ValueError):
             raise ValueError('Invalid value for {}'.format(fieldname))
 
-    def build_date_claimed(self, row, date_format, fieldname='DateClaimed'):
+    def build_transaction_id(self, row, fieldname='TransactionID'):
         try:
-            return datetime.datetime.strptime(row[fieldname], date_format)
-        except Exception:
+            return int(row.get(fieldname))
+        except (TypeError, ValueError):
             raise ValueError('Invalid value for {}'.format(fieldname))
 
+    def build_date_claimed(self, row, date_format, fieldname='DateClaimed'):
+        return self._build_date_value(row, date_format, fieldname)
+
     def build_first_name(self, row, fieldname='FirstName'):
         return self._build_string_value(row, fieldname)
 
@@ -140,10 +487,7 @@ class AbstractCustomerToTransactionCSVConverter:
         return self._build_string_value(row, fieldname)
 
     def build_dob(self, row, date_format, fieldname='DOB'):
-        try:
-            return datetime.datetime.strptime(row[fieldname], date_format)
-        except Exception:
-            raise ValueError('Invalid value for {}'.format(fieldname))
+        return self._build_date_value(row, date_format, fieldname)
 
     def build_item_id(self, row, fieldname='ItemID'):
         return self._build_string_value(row, fieldname)
@@ -166,33 +510,308 @@ class AbstractCustomerToTransactionCSVConverter:
     def build_health_fund(self, row, fieldname='HealthFund'):
         return self._build_string_value(row, fieldname)
 
+    # Column builders, the bulk counterparts of the builders above. Each
+    # takes the raw `pandas.DataFrame` and returns a Series named after the
+    # source field, with invalid values set to NA.
+
+    def _raw_column(self, frame, fieldname):
+        """Returns the raw values of `fieldname`, or blanks if the file has
+        no such column, so every row reports an invalid value as in
+        `convert`."""
+        if fieldname in frame:
+            return frame[fieldname]
+        return pd.Series('', index=frame.index, name=fieldname, dtype=str)
+
+    def _build_string_column(self, frame, fieldname):
+        column = self._raw_column(frame, fieldname)
+        return column.where(column.notna() & (column != ''))
+
+    def _build_monetary_column(self, frame, fieldname):
+        # astype calls float() on each value, the same rule as
+        # `_build_monetary_value`. It stops at the first invalid value, and
+        # only then is the column converted value by value, so a row's
+        # result never depends on the other rows in the column.
+        column = self._raw_column(frame, fieldname)
+        try:
+            return column.astype(float)
+        except ValueError:
+            return pd.Series([_float_or_nan(value) for value in column],
+                             index=column.index, name=column.name,
+                             dtype=float)
+
+    def _build_date_column(self, frame, date_format, fieldname):
+        return pd.to_datetime(self._raw_column(frame, fieldname),
+                              format=date_format,
+                              errors='coerce', cache=True)
+
+    def build_transaction_id_column(self, frame, fieldname='TransactionID'):
+        # Converted with int(), as `build_transaction_id`, value by value
+        # if astype stops at an invalid (or too large) value
+        column = self._raw_column(frame, fieldname)
+        try:
+            return column.astype(int)
+        except (TypeError, ValueError, OverflowError):
+            return pd.Series([_int_or_none(value) for value in column],
+                             index=column.index, name=column.name,
+                             dtype=object)
+
+    def build_date_claimed_column(self, frame, date_format,
+                                  fieldname='DateClaimed'):
+        return self._build_date_column(frame, date_format, fieldname)
+
+    def build_first_name_column(self, frame, fieldname='FirstName'):
+        return self._build_string_column(frame, fieldname)
+
+    def build_last_name_column(self, frame, fieldname='LastName'):
+        return self._build_string_column(frame, fieldname)
+
+    def build_dob_column(self, frame, date_format, fieldname='DOB'):
+        return self._build_date_column(frame, date_format, fieldname)
+
+    def build_item_id_column(self, frame, fieldname='ItemID'):
+        return self._build_string_column(frame, fieldname)
+
+    def build_item_description_column(self, frame,
+                                      fieldname='ItemDescription'):
+        return self._build_string_column(frame, fieldname)
+
+    def build_cost_column(self, frame, fieldname='Cost'):
+        return self._build_monetary_column(frame, fieldname)
+
+    def build_fund_cover_column(self, frame, fieldname='FundCover'):
+        return self._build_monetary_column(frame, fieldname)
+
+    def build_payment_method_column(self, frame, fieldname='PaymentMethod'):
+        return self._build_string_column(frame, fieldname)
+
+    def build_provider_column(self, frame, fieldname='Provider'):
+        return self._build_string_column(frame, fieldname)
+
+    def build_health_fund_column(self, frame, fieldname='HealthFund'):
+        return self._build_string_column(frame, fieldname)
+
     def convert_row_to_transaction(self, row) -> Transaction:
-        raise NotImplementedError  # noqa
+        if self._field_plan is None:
+            raise NotImplementedError  # noqa
+        # Passed positionally, which is cheaper than binding 12 keywords
+        return Transaction(*self._output_order(
+            [build(row) for _, build in self._field_plan]))
+
+    def convert_row_to_output_tuple(self, row) -> tuple:
+        """Converts a raw row straight into formatted csv values, in the
+        writer's `field_names` order."""
+        if self._output_plan is None:
+            return self.normalised_csv_writer.tuplify_transaction(
+                self.convert_row_to_transaction(row))
+        return self._output_order([build(row) for build in self._output_plan])
+
+    def _convert_rows(self, reader, header, convert_row, on_error):
+        """Converts the raw rows from a csv `reader` with `convert_row`.
+        Records are numbered from 0 (blank lines are skipped, as
+        csv.DictReader does) and a record that fails is passed to `on_error`
+        along with its exception.
+        """
+        width = len(header)
+        for i, values in enumerate(filter(None, reader)):
+            if len(values) < width:  # Padded like csv.DictReader
+                values += [None] * (width - len(values))
+            try:
+                converted = convert_row(dict(zip(header, values)))
+            except Exception as e:
+                on_error(i, e)
+            else:
+                yield converted
+
+    def _iter_converted_rows(self, file_path, convert_row):
+        error_count = 0
+
+        def log_error(record, error):
+            nonlocal error_count
+            error_count += 1
+            _log_conversion_error(record + 2, error)
+
+        with open(file_path) as f:
+            # csv.reader with a header read once is cheaper per row than
+            # csv.DictReader
+            reader = csv.reader(f)
+            header = next(reader, [])
+            yield from self._convert_rows(reader, header, convert_row,
+                                          log_error)
+
+        if error_count:
+            logger.error('Errors: %d', error_count)
+
+    def iter_transactions(self, file_path) -> Iterator[Transaction]:
+        """This method will lazily convert a raw csv file into
+        `Transaction` objects, one row at a time"""
+        return self._iter_converted_rows(file_path,
+                                         self.convert_row_to_transaction)
+
+    def iter_output_rows(self, file_path) -> Iterator[tuple]:
+        """This method will lazily convert a raw csv file into rows of
+        formatted csv values, one row at a time"""
+        return self._iter_converted_rows(file_path,
+                                         self.convert_row_to_output_tuple)
 
     def convert_raw_csv_to_transaction(self, file_path) -> List[Transaction]:
         """This method will convert a raw csv file into a
         list of `Transaction` objects"""
-        transactions = []
+        return list(self.iter_transactions(file_path))
+
+    def convert(self, file_path, output_file_name):
+        rows = self.iter_output_rows(file_path)
+        # Start reading before the output file is opened, so a bad input
+        # path does not truncate an existing output file
+        first_row = list(itertools.islice(rows, 1))
+        self.normalised_csv_writer.write_rows(itertools.chain(first_row, rows),
+                                              output_file_name)
+
+    def convert_chunk(self, file_path, header, start, end):
+        """Converts the raw rows between the byte offsets `start` and `end`
+        of a csv file (aligned to line breaks) into csv text.
+
+        Returns the text, the number of records in the chunk and a list of
+        (record, error message) pairs for the records that failed, with
+        records numbered from 0 within the chunk.
+        """
+        with open(file_path, 'rb') as f:
+            f.seek(start)
+            data = f.read(end - start)
+        rows = [values for values in csv.reader(io.TextIOWrapper(
+            io.BytesIO(data))) if values]
+
+        errors = []
+        output = io.StringIO()
+        converted = self._convert_rows(
+            rows, header, self.convert_row_to_output_tuple,
+            lambda record, error: errors.append((record, str(error))))
+        self.normalised_csv_writer.write_rows_to(
+            output, converted, lambda error: errors.append((None, str(error))))
+        return output.getvalue(), len(rows), errors
+
+    def convert_parallel(self, file_path, output_file_name, workers=None):
+        """Multi-process counterpart of `convert`.
+
+        The raw file is split into `workers` byte ranges aligned to line
+        breaks, which are converted in a process pool and written in order.
+        Each worker creates its own instance of this converter's class, and
+        quoted values spanning several lines are not supported.
+        """
+        workers = workers or os.cpu_count() or 1
+        with open(file_path, 'rb') as f:
+            header_line = f.readline()
+            boundaries = [len(header_line)]
+            size = os.fstat(f.fileno()).st_size
+            if size > boundaries[0]:
+                step = -(-(size - boundaries[0]) // workers)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    while boundaries[-1] < size:
+                        end = data.find(b'\n', boundaries[-1] + step - 1) + 1
+                        boundaries.append(end or size)
+        header = next(csv.reader(io.TextIOWrapper(io.BytesIO(header_line))),
+                      [])
+
+        with ProcessPoolExecutor(workers) as pool:
+            results = pool.map(_convert_chunk, itertools.repeat(type(self)),
+                               itertools.repeat(file_path),
+                               itertools.repeat(header), boundaries[:-1],
+                               boundaries[1:])
+            self.normalised_csv_writer.write_chunks(
+                self._log_chunk_errors(results), output_file_name)
+
+    def _log_chunk_errors(self, results):
+        """Logs the errors from `convert_chunk` results against their row in
+        the whole file, yielding each chunk's csv text."""
+        records = 0
         error_count = 0
-        with open(file_path) as f:
-            reader = csv.DictReader(f)
-            for i, row in enumerate(reader, start=2):
-                try:
-                    transactions.append(self.convert_row_to_transaction(row))
-                except Exception as e:
+        for text, chunk_records, errors in results:
+            for record, error in errors:
+                if record is None:  # Could not be written
+                    logger.error(error)
+                else:
                     error_count += 1
-                    logger.error('Error converting record to Transaction '
-                                 '(Error: {}): Row {}'.format(e, i))
+                    _log_conversion_error(records + record + 2, error)
+            records += chunk_records
+            yield text
 
         if error_count:
-            logger.error('Errors: {}'.format(error_count))
-        return transactions
-
-    def convert(self, file_path, output_file_name):
-        transactions = self.convert_raw_csv_to_transaction(file_path)
-        self.normalised_csv_writer.create_csv(transactions, output_file_name)
-
+            logger.error('Errors: %d', error_count)
+
+    def convert_bulk(self, file_path, output_file_name):
+        """Vectorised counterpart of `convert`, which requires pandas.
+
+        The whole file is parsed and validated column by column using the
+        `_column` builders named after the builders in `FIELD_PLAN`.
+        Invalid rows are reported and dropped like in `convert`: short rows
+        are padded, extra values on long rows are ignored and missing
+        columns are reported as invalid values on every row. Rows with a
+        value that needs escaping are reported and dropped too.
+
+        Only converters that rely on their `FIELD_PLAN` (and do not override
+        `convert_row_to_transaction` or the writer's `tuplify_transaction`)
+        are supported, and a builder they
+        override needs a matching `_column` override.
+
+        Known differences from `convert`:
+        - A monetary value of 'nan' is accepted by `float` but is reported
+          as invalid here, since NaN marks invalid values.
+        - On pandas versions with nanosecond-only timestamps, dates outside
+          the years 1677-2262 are reported as invalid.
+        """
+        if pd is None:
+            raise ImportError('convert_bulk requires pandas')
+        if self._output_plan is None:
+            raise NotImplementedError('convert_bulk only supports converters '
+                                      'that rely on their FIELD_PLAN and '
+                                      'the default tuplify_transaction')
+        for _, builder, _ in self.FIELD_PLAN:
+            row_owner = _defining_class(type(self), builder)
+            column_owner = _defining_class(type(self), builder + '_column')
+            if row_owner is not column_owner and issubclass(row_owner,
+                                                            column_owner):
+                raise NotImplementedError(
+                    'convert_bulk cannot use {0} because it is overridden '
+                    'without {0}_column'.format(builder))
 
+        with open(file_path) as f:
+            header = next(csv.reader(f), [])
+        if not header:  # Empty file, as in `convert`
+            self.normalised_csv_writer.write_chunks([], output_file_name)
+            return
+        # Reading a fixed set of columns lets the C parser accept ragged rows
+        frame = pd.read_csv(file_path, dtype=str, keep_default_na=False,
+                            usecols=range(len(header)))
+        columns = {}
+        errors = []
+        invalid = pd.Series(False, index=frame.index)
+        for attribute, builder, kwargs in self.FIELD_PLAN:
+            column = getattr(self, builder + '_column')(frame, **kwargs)
+            failed = column.isna() & ~invalid
+            errors.extend((i, column.name) for i in frame.index[failed])
+            invalid |= failed
+            columns[attribute] = column
+
+        transactions = pd.DataFrame(columns)[~invalid]
+        text, unwritable = self.normalised_csv_writer.format_frame(
+            transactions)
+
+        # Logged in row order, as `convert` does
+        failures = [(i, 'Invalid value for {}'.format(fieldname), True)
+                    for i, fieldname in errors]
+        failures.extend((i, error, False) for i, error in unwritable)
+        for i, error, converting in sorted(failures,
+                                           key=operator.itemgetter(0)):
+            if converting:
+                _log_conversion_error(i + 2, error)
+            else:
+                logger.error(error)
+        if errors:
+            logger.error('Errors: %d', len(errors))
+
+        self.normalised_csv_writer.write_chunks([text], output_file_name)
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class ABCConverter(AbstractCustomerToTransactionCSVConverter):
     """Converter for Customer ABC"""
 
@@ -201,52 +820,66 @@ class ABCConverter(AbstractCustomerToTransactionCSVConverter):
     def build_health_fund(self, *args, **kwargs):
         return self.HEALTH_FUND
 
-    def convert_row_to_transaction(self, row) -> Transaction:
-        return Transaction(
-            transaction_id=self.build_transaction_id(row),
-            date_claimed=self.build_date_claimed(row, '%d/%m/%Y'),
-            dob=self.build_dob(row, '%d/%m/%Y'),
-            first_name=self.build_first_name(row),
-            last_name=self.build_last_name(row),
-            item_id=self.build_item_id(row),
-            item_description=self.build_item_description(row),
-            cost=self.build_cost(row),
-            fund_cover=self.build_fund_cover(row, fieldname='FundCoverAmount'),
-            payment_method=self.build_payment_method(row),
-            provider=self.build_provider(row, fieldname='ProviderCode'),
-            health_fund=self.build_health_fund()
-        )
-
-
+    def build_health_fund_column(self, frame, *args, **kwargs):
+        return pd.Series(self.HEALTH_FUND, index=frame.index,
+                         name='HealthFund')
+
+    FIELD_PLAN = (  # type: ClassVar[Optional[FieldPlan]]
+        ('transaction_id', 'build_transaction_id', {}),
+        ('date_claimed', 'build_date_claimed', {'date_format': '%d/%m/%Y'}),
+        ('dob', 'build_dob', {'date_format': '%d/%m/%Y'}),
+        ('first_name', 'build_first_name', {}),
+        ('last_name', 'build_last_name', {}),
+        ('item_id', 'build_item_id', {}),
+        ('item_description', 'build_item_description', {}),
+        ('cost', 'build_cost', {}),
+        ('fund_cover', 'build_fund_cover', {'fieldname': 'FundCoverAmount'}),
+        ('payment_method', 'build_payment_method', {}),
+        ('provider', 'build_provider', {'fieldname': 'ProviderCode'}),
+        ('health_fund', 'build_health_fund', {}),
+    )
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class CoverallConverter(AbstractCustomerToTransactionCSVConverter):
     """Converter for Customer ABC"""
 
     def build_first_name(self, row, fieldname='FirstName'):
         """Needs to merge MiddleName"""
-        first_name = super(CoverallConverter, self).build_first_name(row,
-                                                                     fieldname)
-        if row['MiddleName']:
-            return '{} {}'.format(first_name, row['MiddleName'])
+        first_name = row.get(fieldname)
+        if not first_name:
+            raise ValueError('Invalid value for {}'.format(fieldname))
+        middle_name = row.get('MiddleName')
+        if middle_name:
+            return '{} {}'.format(first_name, middle_name)
 
         return first_name
 
-    def convert_row_to_transaction(self, row) -> Transaction:
-        return Transaction(
-            transaction_id=self.build_transaction_id(row),
-            date_claimed=self.build_date_claimed(row, '%d-%b-%y'),
-            first_name=self.build_first_name(row),
-            last_name=self.build_last_name(row),
-            dob=self.build_dob(row, '%d/%m/%Y', fieldname='DateOfBirth'),
-            item_id=self.build_item_id(row),
-            item_description=self.build_item_description(row,
-                                                         fieldname='ItemDesc'),
-            cost=self.build_cost(row),
-            fund_cover=self.build_fund_cover(row),
-            payment_method=self.build_payment_method(row,
-                                                     fieldname='PaymentType'),
-            provider=self.build_provider(row),
-            health_fund=self.build_health_fund(row)
-        )
+    def build_first_name_column(self, frame, fieldname='FirstName'):
+        """Needs to merge MiddleName"""
+        first_name = super(CoverallConverter, self).build_first_name_column(
+            frame, fieldname)
+        middle_name = self._raw_column(frame, 'MiddleName').fillna('')
+        return first_name.where(middle_name == '',
+                                first_name + ' ' + middle_name)
+
+    FIELD_PLAN = (  # type: ClassVar[Optional[FieldPlan]]
+        ('transaction_id', 'build_transaction_id', {}),
+        ('date_claimed', 'build_date_claimed', {'date_format': '%d-%b-%y'}),
+        ('first_name', 'build_first_name', {}),
+        ('last_name', 'build_last_name', {}),
+        ('dob', 'build_dob', {'date_format': '%d/%m/%Y',
+                              'fieldname': 'DateOfBirth'}),
+        ('item_id', 'build_item_id', {}),
+        ('item_description', 'build_item_description',
+         {'fieldname': 'ItemDesc'}),
+        ('cost', 'build_cost', {}),
+        ('fund_cover', 'build_fund_cover', {}),
+        ('payment_method', 'build_payment_method',
+         {'fieldname': 'PaymentType'}),
+        ('provider', 'build_provider', {}),
+        ('health_fund', 'build_health_fund', {}),
+    )
 
 
 if __name__ == '__main__':  # pragma: no cover
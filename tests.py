@@ -1,9 +1,47 @@
+import csv
 import unittest
 import datetime
 
 import os
 
-from data_normaliser import TransactionsCSVWriter, Transaction, CoverallConverter, ABCConverter
+from data_normaliser import TransactionsCSVWriter, Transaction, CoverallConverter, ABCConverter, pd, _DATE_PARSERS, \
+    AbstractCustomerToTransactionCSVConverter, _TRANSACTION_ATTRIBUTES
+
+
+class RowConverter(AbstractCustomerToTransactionCSVConverter):
+    """Converter without a FIELD_PLAN that builds each Transaction itself"""
+
+    def convert_row_to_transaction(self, row) -> Transaction:
+        return Transaction(
+            transaction_id=self.build_transaction_id(row),
+            date_claimed=self.build_date_claimed(row, '%d/%m/%Y'),
+            first_name=self.build_first_name(row),
+            last_name='Custom',
+            dob=self.build_dob(row, '%d/%m/%Y'),
+            item_id=self.build_item_id(row),
+            item_description=self.build_item_description(row),
+            cost=self.build_cost(row),
+            fund_cover=self.build_fund_cover(row, fieldname='FundCoverAmount'),
+            payment_method=self.build_payment_method(row),
+            provider=self.build_provider(row, fieldname='ProviderCode'),
+            health_fund='Row'
+        )
+
+
+class UpperWriter(TransactionsCSVWriter):
+    """Writer that upper cases every value"""
+
+    def tuplify_transaction(self, transaction: Transaction) -> tuple:
+        return tuple(str(value).upper()
+                     for value in super().tuplify_transaction(transaction))
+
+
+class UpperConverter(ABCConverter):
+    """ABC converter that writes through an `UpperWriter`"""
+
+    def __init__(self):
+        super().__init__()
+        self.normalised_csv_writer = UpperWriter()
 
 
 class TransactionsCSVWriterTestCase(unittest.TestCase):
@@ -45,6 +83,22 @@ class TransactionsCSVWriterTestCase(unittest.TestCase):
             'HealthFund': transaction.health_fund,
         })
 
+    def test_dictify_returns_new_dict(self):
+        writer = TransactionsCSVWriter()
+        dict_ = writer.dictify_transaction(self.transaction)
+        dict_['FirstName'] = 'Changed'
+
+        self.assertIsNot(writer.dictify_transaction(self.transaction), dict_)
+        self.assertEqual(
+            writer.dictify_transaction(self.transaction)['FirstName'], 'Ash')
+
+    def test_tuplify_matches_dictify(self):
+        writer = TransactionsCSVWriter()
+        dict_ = writer.dictify_transaction(self.transaction)
+
+        self.assertEqual(writer.tuplify_transaction(self.transaction),
+                         tuple(dict_[name] for name in writer.field_names))
+
     def test_correctly_create_csv(self):
         try:
             writer = TransactionsCSVWriter()
@@ -61,6 +115,31 @@ class TransactionsCSVWriterTestCase(unittest.TestCase):
                 pass
 
 
+    @unittest.skipIf(pd is None, 'pandas is not installed')
+    def test_create_csv_from_frame_matches_create_csv(self):
+        unwritable = Transaction(*[getattr(self.transaction, name)
+                                   for name in _TRANSACTION_ATTRIBUTES])
+        unwritable.item_description = 'Teeth, new'
+        transactions = [self.transaction, unwritable]
+        frame = pd.DataFrame({name: [getattr(transaction, name)
+                                     for transaction in transactions]
+                              for name in _TRANSACTION_ATTRIBUTES})
+        try:
+            writer = TransactionsCSVWriter()
+            with self.assertLogs('data_normaliser', level='ERROR') as logs:
+                writer.create_csv(transactions, 'testcsv')
+            with self.assertLogs('data_normaliser', level='ERROR') as bulk:
+                writer.create_csv_from_frame(frame, 'testframe')
+            self.assertEqual(bulk.output, logs.output)
+            with open('testcsv.csv') as rows, open('testframe.csv') as f:
+                self.assertEqual(f.read(), rows.read())
+        finally:  # Cleanup files
+            for file in ['testcsv.csv', 'testframe.csv']:
+                try:
+                    os.remove(file)
+                except OSError:  # pragma: no cover
+                    pass
+
 class CoverterTestCase(unittest.TestCase):
 
     def test_ABC_converter(self):
@@ -85,6 +164,36 @@ class CoverterTestCase(unittest.TestCase):
         self.assertEqual(transaction.dob,
                          datetime.datetime(year=2014, day=1, month=1))
         self.assertEqual(transaction.health_fund, abc.HEALTH_FUND)
+        self.assertEqual(
+            (transaction.transaction_id, transaction.first_name,
+             transaction.last_name, transaction.item_id,
+             transaction.item_description, transaction.cost,
+             transaction.fund_cover, transaction.payment_method,
+             transaction.provider),
+            (1, 'Ash', 'Ramesh', 'AAA', 'BBBB', 10, 10, 'Cash', 'ABCX'))
+
+    def test_output_tuple_matches_transaction(self):
+        coverall = CoverallConverter()
+        row = {
+            'TransactionID': '1',
+            'DateClaimed': '4-Feb-17',
+            'DateOfBirth': '4/06/1995',
+            'FirstName': 'Ash',
+            'MiddleName': 'Baab',
+            'LastName': 'Ramesh',
+            'ItemID': 'AAA',
+            'ItemDesc': 'BBBB',
+            'Cost': '10',
+            'FundCover': '10',
+            'PaymentType': 'Cash',
+            'Provider': 'ABCX',
+            'HealthFund': 'Coverall'
+        }
+
+        transaction = coverall.convert_row_to_transaction(row)
+        self.assertEqual(
+            coverall.convert_row_to_output_tuple(row),
+            coverall.normalised_csv_writer.tuplify_transaction(transaction))
 
     def test_ABC_invalid_data(self):
         abc = ABCConverter()
@@ -199,3 +308,297 @@ class CoverterTestCase(unittest.TestCase):
 
         row['MiddleName'] = 'Bab'
         self.assertEqual(c.build_first_name(row), 'Ash Bab')
+
+    def test_date_parsing_is_cached(self):
+        abc = ABCConverter()
+        row = {'DateClaimed': '01/01/2017'}
+
+        first = abc.build_date_claimed(row, '%d/%m/%Y')
+        self.assertIs(abc.build_date_claimed(row, '%d/%m/%Y'), first)
+
+        row['DateClaimed'] = '01-01/2017'
+        for _ in range(2):  # Failed parses are not cached
+            self.assertRaises(ValueError, abc.build_date_claimed, row,
+                              '%d/%m/%Y')
+
+    def test_iter_transactions_is_lazy(self):
+        abc = ABCConverter()
+        transactions = abc.iter_transactions('datafiles/ABC_2017_02_01.csv')
+
+        self.assertIsInstance(next(transactions), Transaction)
+        self.assertEqual(len(list(transactions)), 21)  # 1 invalid row
+
+    def test_raw_csv_blank_and_short_rows(self):
+        file = 'testraw.csv'
+        try:
+            with open(file, 'w') as f:
+                f.write('TransactionID,DateClaimed,DOB,FirstName,LastName,'
+                        'ItemID,ItemDescription,Cost,FundCoverAmount,'
+                        'PaymentMethod,ProviderCode\n'
+                        '\n'
+                        '1,01/01/2017,01/01/2014,Ash,Ramesh,AAA,BBBB,10,10,'
+                        'Cash,ABCX\n'
+                        '2,01/01/2017,01/01/2014,Ash,Ramesh,AAA,BBBB,10,10\n')
+
+            with self.assertLogs('data_normaliser', level='ERROR') as logs:
+                transactions = ABCConverter().convert_raw_csv_to_transaction(
+                    file)
+            self.assertEqual(len(transactions), 1)
+            self.assertIn('Invalid value for PaymentMethod): Row 3',
+                          logs.output[0])
+        finally:  # Cleanup file
+            try:
+                os.remove(file)
+            except OSError:  # pragma: no cover
+                pass
+
+    def test_parallel_matches_row_by_row(self):
+        converters = [
+            (ABCConverter(), 'datafiles/ABC_2017_02_01.csv'),
+            (CoverallConverter(), 'datafiles/Coverall_2017_02_18.csv'),
+        ]
+        try:
+            for converter, file_path in converters:
+                with self.assertLogs('data_normaliser', level='ERROR') as logs:
+                    converter.convert(file_path, 'testrows')
+                with self.assertLogs('data_normaliser', level='ERROR') as par:
+                    converter.convert_parallel(file_path, 'testparallel',
+                                               workers=3)
+                self.assertEqual(par.output, logs.output)
+                with open('testrows.csv') as rows, \
+                        open('testparallel.csv') as f:
+                    self.assertEqual(f.read(), rows.read())
+        finally:  # Cleanup files
+            for file in ['testrows.csv', 'testparallel.csv']:
+                try:
+                    os.remove(file)
+                except OSError:  # pragma: no cover
+                    pass
+
+    @unittest.skipIf(pd is None, 'pandas is not installed')
+    def test_bulk_matches_row_by_row(self):
+        converters = [
+            (ABCConverter(), 'datafiles/ABC_2017_02_01.csv'),
+            (CoverallConverter(), 'datafiles/Coverall_2017_02_18.csv'),
+        ]
+        try:
+            for converter, file_path in converters:
+                with self.assertLogs('data_normaliser', level='ERROR') as logs:
+                    converter.convert(file_path, 'testrows')
+                with self.assertLogs('data_normaliser', level='ERROR') as bulk:
+                    converter.convert_bulk(file_path, 'testbulk')
+                self.assertEqual(bulk.output, logs.output)
+                with open('testrows.csv') as rows, open('testbulk.csv') as f:
+                    self.assertEqual(f.read(), rows.read())
+        finally:  # Cleanup files
+            for file in ['testrows.csv', 'testbulk.csv']:
+                try:
+                    os.remove(file)
+                except OSError:  # pragma: no cover
+                    pass
+
+    @unittest.skipIf(pd is None, 'pandas is not installed')
+    def test_bulk_matches_row_by_row_on_irregular_files(self):
+        header = ('TransactionID,DateClaimed,DOB,FirstName,LastName,ItemID,'
+                  'ItemDescription,Cost,FundCoverAmount,PaymentMethod')
+        body = ('1,01/01/2017,01/01/2014,Ash,Ramesh,AAA,BBBB,10,10,Cash\n'
+                '\n'
+                '2,01/01/2017,01/01/2014,Ash,Ramesh,AAA,BBBB,10,10,Cash,X\n'
+                '4,01/01/2017,01/01/2014,Ash,Ramesh,AAA,"Teeth, new",10,10,'
+                'Cash\n'
+                '5,01/01/2017,01/01/2014,Ash,"Ra\nmesh",AAA,BBBB,10,10,Cash\n'
+                '3,01/01/2017,01/01/2014,Ash,Ramesh,AAA,BBBB,10\n'
+                '1_0,01/01/2017,01/01/2014,Ash,Ramesh,AAA,BBBB,1_0,10,Cash\n')
+        files = [
+            header + ',ProviderCode\n' + body.replace('Cash', 'Cash,ABCX'),
+            header + '\n' + body,  # No ProviderCode column
+        ]
+        try:
+            for content in files:
+                with open('testraw.csv', 'w') as f:
+                    f.write(content)
+                with self.assertLogs('data_normaliser', level='ERROR') as logs:
+                    ABCConverter().convert('testraw.csv', 'testrows')
+                with self.assertLogs('data_normaliser', level='ERROR') as bulk:
+                    ABCConverter().convert_bulk('testraw.csv', 'testbulk')
+                self.assertEqual(bulk.output, logs.output)
+                with open('testrows.csv') as rows, open('testbulk.csv') as f:
+                    self.assertEqual(f.read(), rows.read())
+        finally:  # Cleanup files
+            for file in ['testraw.csv', 'testrows.csv', 'testbulk.csv']:
+                try:
+                    os.remove(file)
+                except OSError:  # pragma: no cover
+                    pass
+
+    @unittest.skipIf(pd is None, 'pandas is not installed')
+    def test_bulk_matches_row_by_row_on_empty_files(self):
+        header = ('TransactionID,DateClaimed,DOB,FirstName,LastName,ItemID,'
+                  'ItemDescription,Cost,FundCoverAmount,PaymentMethod,'
+                  'ProviderCode\n')
+        try:
+            for content in ['', header]:
+                with open('testraw.csv', 'w') as f:
+                    f.write(content)
+                ABCConverter().convert('testraw.csv', 'testrows')
+                ABCConverter().convert_bulk('testraw.csv', 'testbulk')
+                with open('testrows.csv') as rows, open('testbulk.csv') as f:
+                    self.assertEqual(f.read(), rows.read())
+        finally:  # Cleanup files
+            for file in ['testraw.csv', 'testrows.csv', 'testbulk.csv']:
+                try:
+                    os.remove(file)
+                except OSError:  # pragma: no cover
+                    pass
+
+    @unittest.skipIf(pd is None, 'pandas is not installed')
+    def test_bulk_rejects_builders_without_column_builders(self):
+        class RowOnlyConverter(ABCConverter):
+            def build_last_name(self, row, fieldname='LastName'):
+                return 'Custom'
+
+        class BothConverter(RowOnlyConverter):
+            def build_last_name_column(self, frame, fieldname='LastName'):
+                return pd.Series('Custom', index=frame.index, name=fieldname)
+
+        self.assertRaises(NotImplementedError, RowOnlyConverter().convert_bulk,
+                          'datafiles/ABC_2017_02_01.csv', 'testbulk')
+        try:
+            with self.assertLogs('data_normaliser', level='ERROR'):
+                BothConverter().convert_bulk('datafiles/ABC_2017_02_01.csv',
+                                             'testbulk')
+            with open('testbulk.csv') as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual({row['LastName'] for row in rows}, {'Custom'})
+        finally:  # Cleanup file
+            try:
+                os.remove('testbulk.csv')
+            except OSError:  # pragma: no cover
+                pass
+
+    def test_date_parsers_match_strptime(self):
+        values = ['4/06/1995', '31/01/2017', '31/02/2017', '1/13/2017',
+                  '01-01/2017', '4-Feb-17', '31-jan-17', '30-Feb-17',
+                  '4-Foo-17', '1-Jan-69', '1-Jan-68', '']
+        for date_format, parser in _DATE_PARSERS.items():
+            for value in values:
+                try:
+                    expected = datetime.datetime.strptime(value, date_format)
+                except ValueError:
+                    self.assertRaises(ValueError, parser, value)
+                else:
+                    self.assertEqual(parser(value), expected)
+
+    @unittest.skipIf(pd is None, 'pandas is not installed')
+    def test_bulk_monetary_column(self):
+        abc = ABCConverter()
+        frame = pd.DataFrame({'Cost': ['120', ' 80 ', '', 'A']})
+
+        column = abc.build_cost_column(frame)
+        self.assertEqual(column[:2].tolist(), [120.0, 80.0])
+        self.assertTrue(column[2:].isna().all())
+
+        # A value is converted the same way whatever else is in the column
+        valid = abc.build_cost_column(pd.DataFrame({'Cost': ['1_0', '5']}))
+        mixed = abc.build_cost_column(pd.DataFrame({'Cost': ['1_0', 'x']}))
+        self.assertEqual(valid[0], float('1_0'))
+        self.assertEqual(mixed[0], valid[0])
+        self.assertTrue(mixed[1:].isna().all())
+
+    @unittest.skipIf(pd is None, 'pandas is not installed')
+    def test_bulk_transaction_id_column(self):
+        abc = ABCConverter()
+        valid = abc.build_transaction_id_column(
+            pd.DataFrame({'TransactionID': ['1_0', ' 5 ']}))
+        mixed = abc.build_transaction_id_column(
+            pd.DataFrame({'TransactionID': ['1_0', '1.5', '']}))
+        self.assertEqual(valid.tolist(), [10, 5])
+        self.assertEqual(mixed[0], valid[0])
+        self.assertTrue(mixed[1:].isna().all())
+
+    def test_bad_input_keeps_existing_output(self):
+        file = 'testexisting'
+        try:
+            with open('{}.csv'.format(file), 'w') as f:
+                f.write('existing')
+
+            self.assertRaises(FileNotFoundError, ABCConverter().convert,
+                              'datafiles/missing.csv', file)
+            with open('{}.csv'.format(file)) as f:
+                self.assertEqual(f.read(), 'existing')
+        finally:  # Cleanup file
+            try:
+                os.remove('{}.csv'.format(file))
+            except OSError:  # pragma: no cover
+                pass
+
+    def test_converter_without_field_plan(self):
+        row = {
+            'TransactionID': '1',
+            'DateClaimed': '01/01/2017',
+            'DOB': '01/01/2014',
+            'FirstName': 'Ash',
+            'LastName': 'Ramesh',
+            'ItemID': 'AAA',
+            'ItemDescription': 'BBBB',
+            'Cost': '10',
+            'FundCoverAmount': '10',
+            'PaymentMethod': 'Cash',
+            'ProviderCode': 'ABCX'
+        }
+
+        transaction = RowConverter().convert_row_to_transaction(row)
+        self.assertEqual(transaction.last_name, 'Custom')
+        self.assertEqual(transaction.health_fund, 'Row')
+        self.assertRaises(NotImplementedError,
+                          AbstractCustomerToTransactionCSVConverter()
+                          .convert_row_to_transaction, row)
+
+    def test_convert_uses_overridden_convert_row_to_transaction(self):
+        class CustomABCConverter(ABCConverter):
+            def convert_row_to_transaction(self, row):
+                transaction = super().convert_row_to_transaction(row)
+                transaction.last_name = 'Custom'
+                return transaction
+
+        try:
+            for converter in [RowConverter(), CustomABCConverter()]:
+                converter.convert('datafiles/ABC_2017_02_01.csv', 'testrows')
+                with open('testrows.csv') as f:
+                    rows = list(csv.DictReader(f))
+                self.assertEqual(len(rows), 22)  # 1 invalid row
+                self.assertEqual({row['LastName'] for row in rows},
+                                 {'Custom'})
+
+            RowConverter().convert_parallel('datafiles/ABC_2017_02_01.csv',
+                                            'testrows', workers=2)
+            with open('testrows.csv') as f:
+                rows = list(csv.DictReader(f))
+            self.assertEqual({row['LastName'] for row in rows}, {'Custom'})
+        finally:  # Cleanup file
+            try:
+                os.remove('testrows.csv')
+            except OSError:  # pragma: no cover
+                pass
+
+    def test_convert_uses_overridden_tuplify_transaction(self):
+        converter = UpperConverter()
+        try:
+            converter.normalised_csv_writer.create_csv(
+                converter.iter_transactions('datafiles/ABC_2017_02_01.csv'),
+                'testcsv')
+            converter.convert('datafiles/ABC_2017_02_01.csv', 'testrows')
+            converter.convert_parallel('datafiles/ABC_2017_02_01.csv',
+                                       'testparallel', workers=2)
+            with open('testcsv.csv') as f:
+                expected = f.read()
+            self.assertIn('-JAN-17', expected)
+            for file in ['testrows.csv', 'testparallel.csv']:
+                with open(file) as f:
+                    self.assertEqual(f.read(), expected)
+        finally:  # Cleanup files
+            for file in ['testcsv.csv', 'testrows.csv', 'testparallel.csv']:
+                try:
+                    os.remove(file)
+                except OSError:  # pragma: no cover
+                    pass